@@ -64,6 +64,8 @@ __all__ = [
     "Log",
 ]
 
+import threading
+
 import lxml.etree
 
 from .elements import (
@@ -77,6 +79,7 @@ from .elements import (
     SatNode,
     SOPNode,
 )
+from .parsing import XML_PARSER_OPTIONS
 from .process_list import ProcessList
 from .process_nodes import (
     ASC_CDL,
@@ -91,7 +94,30 @@ from .process_nodes import (
 from .values import ASC_CDL_Style, BitDepth, Channel, Interpolation1D, Interpolation3D
 
 
-def read_clf(path) -> ProcessList:
+_XML_PARSERS = threading.local()
+
+
+def _xml_parser() -> lxml.etree.XMLParser:
+    """
+    Return the XML parser of the calling thread, configured for reading *CLF*
+    documents.
+
+    A parser can be reused for any number of documents but must not be shared
+    between threads, hence one parser is created lazily per thread. See
+    :data:`colour_clf_io.parsing.XML_PARSER_OPTIONS` for its options.
+
+    Returns
+    -------
+    :class:`lxml.etree.XMLParser`
+    """
+    parser = getattr(_XML_PARSERS, "parser", None)
+    if parser is None:
+        parser = lxml.etree.XMLParser(**XML_PARSER_OPTIONS)
+        _XML_PARSERS.parser = parser
+    return parser
+
+
+def read_clf(path, array_workers: int | None = None) -> ProcessList:
     """
     Read given *CLF* file and return the resulting `ProcessList`.
 
@@ -99,6 +125,9 @@ def read_clf(path) -> ProcessList:
     ----------
     path
         Path to the *CLF* file.
+    array_workers
+        Number of threads used to parse the *Array* values concurrently, see
+        :meth:`colour_clf_io.ProcessList.from_xml`.
 
     Returns
     -------
@@ -110,13 +139,13 @@ def read_clf(path) -> ProcessList:
         If the given file does not contain a valid CLF document.
 
     """
-    xml = lxml.etree.parse(path)  # noqa: S320
+    xml = lxml.etree.parse(path, parser=_xml_parser())  # noqa: S320
     xml_process_list = xml.getroot()
-    root = ProcessList.from_xml(xml_process_list)
+    root = ProcessList.from_xml(xml_process_list, array_workers)
     return root
 
 
-def parse_clf(text):
+def parse_clf(text, array_workers: int | None = None):
     """
     Read given string as a *CLF* document and return the resulting `ProcessList`.
 
@@ -124,6 +153,9 @@ def parse_clf(text):
     ----------
     text
         String that contains the *CLF* document.
+    array_workers
+        Number of threads used to parse the *Array* values concurrently, see
+        :meth:`colour_clf_io.ProcessList.from_xml`.
 
     Returns
     -------
@@ -135,6 +167,6 @@ def parse_clf(text):
         If the given string does not contain a valid CLF document.
 
     """
-    xml = lxml.etree.fromstring(text)  # noqa: S320
-    root = ProcessList.from_xml(xml)
+    xml = lxml.etree.fromstring(text, parser=_xml_parser())  # noqa: S320
+    root = ProcessList.from_xml(xml, array_workers)
     return root
@@ -10,8 +10,13 @@ typically are child elements of Process Nodes.
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass
+import math
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 
+import numpy as np
 import numpy.typing as npt
 from typing_extensions import Self
 
@@ -21,12 +26,13 @@ from colour_clf_io.parsing import (
     XMLParsable,
     child_element,
     child_element_or_exception,
-    map_optional,
+    lookup_optional,
+    parse_floats,
     retrieve_attributes,
     retrieve_attributes_as_float,
     three_floats,
 )
-from colour_clf_io.values import Channel
+from colour_clf_io.values import CHANNEL_BY_VALUE, Channel
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2013 Colour Developers"
@@ -48,8 +54,67 @@ __all__ = [
     "ExponentParams",
 ]
 
+# Values of the *Array* elements that were parsed ahead of the process nodes, keyed
+# by their XML element, see :func:`parsed_array_values`.
+_PARSED_ARRAY_VALUES: ContextVar[Mapping | None] = ContextVar(
+    "_PARSED_ARRAY_VALUES", default=None
+)
+
+
+@contextmanager
+def parsed_array_values(values: Mapping) -> Iterator[None]:
+    """
+    Make :meth:`Array.from_xml` use the given pre-parsed values, instead of parsing
+    the text of the *Array* elements, within the context.
 
-@dataclass
+    Parameters
+    ----------
+    values
+        Values of *Array* elements keyed by their XML element. Elements that are
+        not contained are parsed as usual.
+    """
+    token = _PARSED_ARRAY_VALUES.set(values)
+    try:
+        yield
+    finally:
+        _PARSED_ARRAY_VALUES.reset(token)
+
+
+_CALIBRATION_INFO_ATTRIBUTES = (
+    ("display_device_serial_num", "DisplayDeviceSerialNum"),
+    ("display_device_host_name", "DisplayDeviceHostName"),
+    ("operator_name", "OperatorName"),
+    ("calibration_date_time", "CalibrationDateTime"),
+    ("measurement_probe", "MeasurementProbe"),
+    ("calibration_software_name", "CalibrationSoftwareName"),
+    ("calibration_software_version", "CalibrationSoftwareVersion"),
+)
+
+_INFO_ATTRIBUTES = (
+    ("app_release", "AppRelease"),
+    ("copyright", "Copyright"),
+    ("revision", "Revision"),
+    ("aces_transform_id", "ACEStransformID"),
+    ("aces_user_name", "ACESuserName"),
+)
+
+_LOG_PARAMS_ATTRIBUTES = (
+    ("base", "base"),
+    ("log_side_slope", "logSideSlope"),
+    ("log_side_offset", "logSideOffset"),
+    ("lin_side_slope", "linSideSlope"),
+    ("lin_side_offset", "linSideOffset"),
+    ("lin_side_break", "linSideBreak"),
+    ("linear_slope", "linearSlope"),
+)
+
+_EXPONENT_PARAMS_ATTRIBUTES = (
+    ("exponent", "exponent"),
+    ("offset", "offset"),
+)
+
+
+@dataclass(slots=True)
 class Array(XMLParsable):
     """
     Represents an Array element.
@@ -59,8 +124,33 @@ class Array(XMLParsable):
     https://docs.acescentral.com/specifications/clf/#array
     """
 
-    values: list[float]
+    values: npt.NDArray[np.float64]
     dim: tuple[int, ...]
+    _shape: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        Compute the shape of the array returned by
+        :meth:`~colour_clf_io.elements.Array.as_array`.
+        """
+        shape = self.dim
+        # Strip the dimensions with value 1.
+        while len(shape) > 1 and shape[-1] == 1:
+            shape = shape[:-1]
+        self._shape = shape
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Return whether the given object is an Array with the same `dim` and `values`.
+
+        The method generated by :func:`dataclasses.dataclass` compares the `values`
+        element-wise and cannot be reduced to a single :class:`bool`.
+        """
+        if not isinstance(other, Array):
+            return NotImplemented
+        return self.dim == other.dim and np.array_equal(self.values, other.values)
+
+    __hash__ = None  # pyright: ignore
 
     @classmethod
     def from_xml(cls, xml, config: ParserConfig) -> Self | None:  # noqa: ARG003
@@ -82,9 +172,29 @@ class Array(XMLParsable):
         if xml is None:
             return None
         dim = tuple(map(int, xml.get("dim").split()))
-        values = list(map(float, xml.text.split()))
+        count = math.prod(dim)
+        parsed_values = _PARSED_ARRAY_VALUES.get()
+        values = None if parsed_values is None else parsed_values.get(xml)
+        if values is None:
+            values = parse_floats(xml.text, count=count)
+        elif values.size != count:
+            raise ParsingError(
+                f"Expected {count} float values, but found {values.size}."
+            )
         return cls(values=values, dim=dim)
 
+    @property
+    def values_list(self) -> list[float]:
+        """
+        Return the values of the array as a :class:`list` of :class:`float`.
+
+        Returns
+        -------
+        :class:`list` of :class:`float`
+            The flat list of values.
+        """
+        return np.asarray(self.values).tolist()
+
     def as_array(self) -> npt.ArrayLike:
         """
         Convert the CLF element into a numpy array.
@@ -92,18 +202,13 @@ class Array(XMLParsable):
         Returns
         -------
         :class:`numpy.ndarray`
-            Array of shape `dim` with the data from `values`.
+            Array of shape `dim`, without trailing dimensions of size 1, with the
+            data from `values`. The array is a view on `values` and no copy is made.
         """
-        import numpy as np
-
-        dim = self.dim
-        # Strip the dimensions with value 1.
-        while dim[-1] == 1:
-            dim = dim[:-1]
-        return np.array(self.values).reshape(dim)
+        return np.asarray(self.values).reshape(self._shape)
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationInfo(XMLParsable):
     """
     Represents a Calibration Info element.
@@ -140,18 +245,7 @@ class CalibrationInfo(XMLParsable):
         """
         if xml is None:
             return None
-        attributes = retrieve_attributes(
-            xml,
-            {
-                "display_device_serial_num": "DisplayDeviceSerialNum",
-                "display_device_host_name": "DisplayDeviceHostName",
-                "operator_name": "OperatorName",
-                "calibration_date_time": "CalibrationDateTime",
-                "measurement_probe": "MeasurementProbe",
-                "calibration_software_name": "CalibrationSoftwareName",
-                "calibration_software_version": "CalibrationSoftwareVersion",
-            },
-        )
+        attributes = retrieve_attributes(xml, _CALIBRATION_INFO_ATTRIBUTES)
         return cls(**attributes)
 
 
@@ -168,6 +262,9 @@ class RangeStyle(enum.Enum):
     NO_CLAMP = "noClamp"
 
 
+RANGE_STYLE_BY_VALUE = {member.value: member for member in RangeStyle}
+
+
 class LogStyle(enum.Enum):
     """
     Represents the valid values of the style attribute in a Log element.
@@ -187,6 +284,9 @@ class LogStyle(enum.Enum):
     CAMERA_LOG_TO_LIN = "cameraLogToLin"
 
 
+LOG_STYLE_BY_VALUE = {member.value: member for member in LogStyle}
+
+
 class ExponentStyle(enum.Enum):
     """
     Represents the valid values of the style attribute of an Exponent element.
@@ -208,7 +308,10 @@ class ExponentStyle(enum.Enum):
     MON_CURVE_MIRROR_REV = "monCurveMirrorRev"
 
 
-@dataclass
+EXPONENT_STYLE_BY_VALUE = {member.value: member for member in ExponentStyle}
+
+
+@dataclass(slots=True)
 class SOPNode(XMLParsable):
     """
     Represents a SOPNode element.
@@ -246,7 +349,7 @@ class SOPNode(XMLParsable):
         return cls(slope=slope, offset=offset, power=power)
 
 
-@dataclass
+@dataclass(slots=True)
 class SatNode(XMLParsable):
     """
     Represents a SatNode element.
@@ -283,7 +386,7 @@ class SatNode(XMLParsable):
         return cls(saturation=saturation)
 
 
-@dataclass
+@dataclass(slots=True)
 class Info(XMLParsable):
     """
     Represents a Info element.
@@ -319,23 +422,14 @@ class Info(XMLParsable):
         """
         if xml is None:
             return None
-        attributes = retrieve_attributes(
-            xml,
-            {
-                "app_release": "AppRelease",
-                "copyright": "Copyright",
-                "revision": "Revision",
-                "aces_transform_id": "ACEStransformID",
-                "aces_user_name": "ACESuserName",
-            },
-        )
+        attributes = retrieve_attributes(xml, _INFO_ATTRIBUTES)
         calibration_info = CalibrationInfo.from_xml(
             child_element(xml, "CalibrationInfo", config), config
         )
         return cls(calibration_info=calibration_info, **attributes)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogParams(XMLParsable):
     """
     Represents a Log Param List element.
@@ -372,25 +466,14 @@ class LogParams(XMLParsable):
         """
         if xml is None:
             return None
-        attributes = retrieve_attributes_as_float(
-            xml,
-            {
-                "base": "base",
-                "log_side_slope": "logSideSlope",
-                "log_side_offset": "logSideOffset",
-                "lin_side_slope": "linSideSlope",
-                "lin_side_offset": "linSideOffset",
-                "lin_side_break": "linSideBreak",
-                "linear_slope": "linearSlope",
-            },
-        )
+        attributes = retrieve_attributes_as_float(xml, _LOG_PARAMS_ATTRIBUTES)
 
-        channel = map_optional(Channel, xml.get("channel"))
+        channel = lookup_optional(CHANNEL_BY_VALUE, xml.get("channel"))
 
         return cls(channel=channel, **attributes)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExponentParams(XMLParsable):
     """
     Represents a Exponent Params element.
@@ -422,16 +505,10 @@ class ExponentParams(XMLParsable):
         """
         if xml is None:
             return None
-        attributes = retrieve_attributes_as_float(
-            xml,
-            {
-                "exponent": "exponent",
-                "offset": "offset",
-            },
-        )
+        attributes = retrieve_attributes_as_float(xml, _EXPONENT_PARAMS_ATTRIBUTES)
         exponent = attributes.pop("exponent")
         if exponent is None:
             raise ParsingError("Exponent process node has no `exponent' value.")
-        channel = map_optional(Channel, xml.get("channel"))
+        channel = lookup_optional(CHANNEL_BY_VALUE, xml.get("channel"))
 
         return cls(channel=channel, exponent=exponent, **attributes)
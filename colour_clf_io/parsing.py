@@ -9,13 +9,21 @@ Defines utilities that are used to parse CLF documents.
 from __future__ import annotations
 
 import collections
+import contextlib
+import functools
+import threading
+import warnings
 import xml.etree
 import xml.etree.ElementTree
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from itertools import islice
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import islice, pairwise
 from typing import Callable, TypeVar
 
+import lxml.etree
+import numpy as np
+import numpy.typing as npt
 from typing_extensions import Self, TypeGuard
 
 from colour_clf_io.errors import ParsingError
@@ -28,29 +36,50 @@ __email__ = "colour-developers@colour-science.org"
 __status__ = "Production"
 
 __ALL__ = [
+    "XML_PARSER_OPTIONS",
     "ParserConfig",
+    "CLF_NAMESPACE_CONFIG",
+    "NO_NAMESPACE_CONFIG",
+    "parser_config_for_namespace",
     "XMLParsable",
     "fully_qualified_name",
     "map_optional",
+    "lookup_optional",
     "retrieve_attributes",
     "retrieve_attributes_as_float",
     "must_have",
     "child_element",
+    "child_element_by_tag",
+    "child_element_text",
     "child_elements",
     "child_element_or_exception",
     "element_as_text",
     "elements_as_text_list",
     "sliding_window",
+    "parse_floats",
     "three_floats",
     "element_as_float",
+    "elements_as_float",
 ]
 
 _T = TypeVar("_T")
 
 NAMESPACE_NAME = "urn:AMPAS:CLF:v3.0"
 
+# Options of the XML parsers used for reading *CLF* documents. Blank text, comments
+# and ID collection are not needed to build a `ProcessList` and are skipped to
+# reduce the parsing work. Large *LUT* payloads can exceed the default *libxml2*
+# size limits, hence `huge_tree` is enabled.
+XML_PARSER_OPTIONS = {
+    "huge_tree": True,
+    "collect_ids": False,
+    "remove_blank_text": True,
+    "remove_comments": True,
+    "resolve_entities": False,
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ParserConfig:
     """Additional settings for parsing the CLF document.
 
@@ -59,9 +88,51 @@ class ParserConfig:
     namespace_name
         The namespace name used for parsing the CLF document. Usually this should be
         the `CLF_NAMESPACE`, but it can be omitted.
+
+    Attributes
+    ----------
+    ignore_tags
+        Qualified tags of the children of a *ProcessList* element that are not
+        process nodes.
+    description_tag
+        Qualified tag of the *Description* elements.
     """
 
     namespace_name: str | None = NAMESPACE_NAME
+    ignore_tags: frozenset[str] = field(init=False, repr=False, compare=False)
+    description_tag: str = field(init=False, repr=False, compare=False)
+    _namespace_prefix_mapping: dict[str, str] | None = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """
+        Compute the namespaces prefix mapping and the qualified tags used for CLF
+        documents.
+        """
+        # The instance is frozen, the derived attributes are assigned through
+        # "object.__setattr__".
+        object.__setattr__(
+            self,
+            "_namespace_prefix_mapping",
+            {"clf": self.namespace_name} if self.namespace_name else None,
+        )
+        object.__setattr__(
+            self,
+            "ignore_tags",
+            frozenset(
+                fully_qualified_name(name, self)
+                for name in (
+                    "Description",
+                    "InputDescriptor",
+                    "OutputDescriptor",
+                    "Info",
+                )
+            ),
+        )
+        object.__setattr__(
+            self, "description_tag", fully_qualified_name("Description", self)
+        )
 
     def clf_namespace_prefix_mapping(self) -> dict[str, str] | None:
         """Return the namespaces prefix mapping used for CLF documents.
@@ -71,10 +142,38 @@ class ParserConfig:
         :class:`dict[str, str]` that contains the namespaces prefix mappings.
 
         """
-        if self.namespace_name:
-            return {"clf": self.namespace_name}
-        else:
-            return None
+        return self._namespace_prefix_mapping
+
+
+@functools.lru_cache(maxsize=64)
+def _child_xpath(
+    name: str, namespace_name: str | None, xpath_function: str = ""
+) -> lxml.etree.XPath:
+    """
+    Return the compiled XPath object that selects the named children of an element.
+
+    The compiled objects are cached so that every distinct child name is compiled
+    only once.
+
+    Parameters
+    ----------
+    name
+        Name of the child elements to select.
+    namespace_name
+        Namespace name of the CLF document, or :py:data:`None`.
+    xpath_function
+        Optional XPath function to evaluate on the child elements.
+
+    Returns
+    -------
+    :class:`lxml.etree.XPath`
+        The compiled XPath object.
+    """
+    if namespace_name:
+        return lxml.etree.XPath(
+            f"clf:{name}{xpath_function}", namespaces={"clf": namespace_name}
+        )
+    return lxml.etree.XPath(f"{name}{xpath_function}")
 
 
 class XMLParsable(ABC):
@@ -89,6 +188,8 @@ class XMLParsable(ABC):
     -   :meth:`~colour_lf_io.parsing.XMLParsable.from_xml`
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_xml(cls, xml, config: ParserConfig) -> Self | None:
@@ -130,11 +231,50 @@ def map_optional(f: Callable, value):
     return None
 
 
+def lookup_optional(value_map: Mapping[str, _T], value: str | None) -> _T | None:
+    """
+    Look up `value` in the given mapping, if `value` is not :py:data:`None`.
+
+    This is typically used to convert attribute values to :class:`enum.Enum` members
+    through a precomputed mapping of values to members.
+
+    Parameters
+    ----------
+    value_map
+        The mapping to look up `value` in.
+    value
+        The value (that might be :py:data:`None`).
+
+    Raises
+    ------
+    :class:`ParsingError` if `value` is not contained in `value_map`.
+
+    Returns
+    -------
+    The value mapped to `value`, or :py:data:`None`.
+
+    Examples
+    --------
+    >>> lookup_optional({"a": 1}, "a")
+    1
+    >>> lookup_optional({"a": 1}, None) is None
+    True
+    """
+    if value is None:
+        return None
+    try:
+        return value_map[value]
+    except KeyError:
+        raise ParsingError(
+            f"Encountered invalid value '{value}', expected one of {list(value_map)}."
+        ) from None
+
+
 def retrieve_attributes(
-    xml, attribute_mapping: dict[str, str]
+    xml, attribute_mapping: Sequence[tuple[str, str]]
 ) -> dict[str, str | None]:
     """
-    Take a dictionary of keys and attribute names and map the attribute names to the
+    Take a sequence of keys and attribute names and map the attribute names to the
     corresponding values from the given XML element. Note that the keys of the
     attribute mapping are not used in any way.
 
@@ -143,7 +283,7 @@ def retrieve_attributes(
     xml
         The XML element to retrieve attributes from.
     attribute_mapping
-        The dictionary containing keys and attribute names.
+        The sequence of key and attribute name pairs.
 
     Returns
     -------
@@ -151,16 +291,17 @@ def retrieve_attributes(
         The resulting dictionary of keys and attribute values.
 
     """
+    attributes = xml.attrib
     return {
-        k: xml.get(attribute_name) for k, attribute_name in attribute_mapping.items()
+        k: attributes.get(attribute_name) for k, attribute_name in attribute_mapping
     }
 
 
 def retrieve_attributes_as_float(
-    xml, attribute_mapping: dict[str, str]
+    xml, attribute_mapping: Sequence[tuple[str, str]]
 ) -> dict[str, float | None]:
     """
-    Take a dictionary of keys and attribute names and map the attribute names to the
+    Take a sequence of keys and attribute names and map the attribute names to the
     corresponding values from the given XML element. Also converts all values to
     :class:`float` values, or :py:data:`None`.
 
@@ -171,7 +312,7 @@ def retrieve_attributes_as_float(
     xml
         The XML element to retrieve attributes from.
     attribute_mapping
-        The dictionary containing keys and attribute names.
+        The sequence of key and attribute name pairs.
 
     Returns
     -------
@@ -179,17 +320,19 @@ def retrieve_attributes_as_float(
         The resulting dictionary of keys and attribute values.
 
     """
-    attributes = retrieve_attributes(xml, attribute_mapping)
-
-    def as_float(value):
+    get = xml.attrib.get
+    _float = float
+    attributes: dict[str, float | None] = {}
+    for key, attribute_name in attribute_mapping:
+        value = get(attribute_name)
         if value is None:
-            return None
-        try:
-            return float(value)
-        except ValueError:
-            return None
-
-    return {key: as_float(value) for key, value in attributes.items()}
+            attributes[key] = None
+        else:
+            try:
+                attributes[key] = _float(value)
+            except ValueError:
+                attributes[key] = None
+    return attributes
 
 
 def must_have(value: _T | None, message) -> TypeGuard[_T]:
@@ -217,9 +360,82 @@ def must_have(value: _T | None, message) -> TypeGuard[_T]:
     return True
 
 
+def fully_qualified_name(name: str, config: ParserConfig) -> str:
+    """
+    Return the fully qualified tag name of a CLF element, i.e., the name prefixed with
+    the namespace of the document in *Clark* notation.
+
+    Parameters
+    ----------
+    name
+        Local name of the element.
+    config
+        Additional parser configuration.
+
+    Returns
+    -------
+    :class:`str`
+        The qualified tag name, or `name` if the document has no namespace.
+
+    Examples
+    --------
+    >>> fully_qualified_name("Array", ParserConfig())
+    '{urn:AMPAS:CLF:v3.0}Array'
+    >>> fully_qualified_name("Array", ParserConfig(namespace_name=None))
+    'Array'
+    """
+    if config.namespace_name:
+        return f"{{{config.namespace_name}}}{name}"
+    return name
+
+
+CLF_NAMESPACE_CONFIG = ParserConfig()
+"""Parser configuration of *CLF* documents that use the CLF namespace."""
+
+NO_NAMESPACE_CONFIG = ParserConfig(namespace_name=None)
+"""Parser configuration of *CLF* documents that do not declare a namespace."""
+
+
+def parser_config_for_namespace(namespace: str | None) -> ParserConfig:
+    """
+    Return the parser configuration for a *CLF* document with the given namespace.
+
+    By default, we would expect the correct namespace as per the specification.
+    But if it is not present, we will still try to parse the document anyway.
+    We won't accept a wrong namespace through.
+
+    Parameters
+    ----------
+    namespace
+        Namespace of the root element of the document, empty or :py:data:`None` if
+        the document does not declare a namespace.
+
+    Raises
+    ------
+    :class:`ParsingError` if the namespace is not the CLF namespace.
+
+    Returns
+    -------
+    :class:`ParserConfig`
+        The shared parser configuration for the namespace.
+
+    Examples
+    --------
+    >>> parser_config_for_namespace(None) is NO_NAMESPACE_CONFIG
+    True
+    >>> parser_config_for_namespace(NAMESPACE_NAME) is CLF_NAMESPACE_CONFIG
+    True
+    """
+    if not namespace:
+        return NO_NAMESPACE_CONFIG
+    if namespace == NAMESPACE_NAME:
+        return CLF_NAMESPACE_CONFIG
+    raise ParsingError(f"Found invalid xmlns attribute in process list: {namespace}")
+
+
 def child_element(
-    xml, name, config: ParserConfig, xpath_function=""
-) -> xml.etree.ElementTree.Element | None | str:
+    xml, name, config: ParserConfig
+) -> xml.etree.ElementTree.Element | None:
     """
     Return a named child element of the given XML element.
 
@@ -231,28 +447,80 @@ def child_element(
         Name of the child element to look for.
     config
         Additional parser configuration.
-    xpath_function
-        Optional XPath function to evaluate on the child element.
+
+    Raises
+    ------
+    :class:`ParsingError` if more than one matching child element is found.
 
     Returns
     -------
-    :class:`xml.etree.ElementTree.Element` or :class`str` or :py:data:`None`
-        The found child element, or the result of the applied XPath function.
-        :py:data:`None` if the child was not found.
+    :class:`xml.etree.ElementTree.Element` or :py:data:`None`
+        The found child element. :py:data:`None` if the child was not found.
 
     """
+    return child_element_by_tag(xml, fully_qualified_name(name, config))
 
-    elements = child_elements(xml, name, config, xpath_function)
-    element_count = len(elements)
-    if element_count == 0:
-        return None
-    elif element_count == 1:
-        return elements[0]
-    else:
+
+def child_element_by_tag(xml, tag: str) -> xml.etree.ElementTree.Element | None:
+    """
+    Return the child element with the given qualified tag of the given XML element.
+
+    Parameters
+    ----------
+    xml
+        XML element to operate on.
+    tag
+        Qualified tag of the child element to look for, e.g. as returned by
+        :func:`fully_qualified_name`.
+
+    Raises
+    ------
+    :class:`ParsingError` if more than one matching child element is found.
+
+    Returns
+    -------
+    :class:`xml.etree.ElementTree.Element` or :py:data:`None`
+        The found child element. :py:data:`None` if the child was not found.
+
+    """
+    elements = xml.iterchildren(tag)
+    element = next(elements, None)
+    if next(elements, None) is not None:
         raise ParsingError(
-            f"Found multiple elements of type {name} in "
+            f"Found multiple elements of type {lxml.etree.QName(tag).localname} in "
             f"element {xml}, but only expected exactly one."
         )
+    return element
+
+
+def child_element_text(xml, name, config: ParserConfig) -> str | None:
+    """
+    Return the text of a named child element of the given XML element.
+
+    Parameters
+    ----------
+    xml
+        XML element to operate on.
+    name
+        Name of the child element to look for.
+    config
+        Additional parser configuration.
+
+    Raises
+    ------
+    :class:`ParsingError` if more than one matching child element is found.
+
+    Returns
+    -------
+    :class:`str` or :py:data:`None`
+        The text of the child element. :py:data:`None` if the child was not found or
+        contains no text.
+
+    """
+    element = child_element(xml, name, config)
+    if element is None:
+        return None
+    return element.text
 
 
 def child_elements(
@@ -279,14 +547,7 @@ def child_elements(
         :py:data:`None` if the child was not found.
 
     """
-    if config.clf_namespace_prefix_mapping():
-        elements = xml.xpath(
-            f"clf:{name}{xpath_function}",
-            namespaces=config.clf_namespace_prefix_mapping(),
-        )
-    else:
-        elements = xml.xpath(f"{name}{xpath_function}")
-    return elements
+    return _child_xpath(name, config.namespace_name, xpath_function)(xml)
 
 
 def child_element_or_exception(
@@ -317,7 +578,6 @@ def child_element_or_exception(
         The found child element.
     """
     element = child_element(xml, name, config)
-    assert not isinstance(element, str)  # noqa: S101
     if element is None:
         raise ParsingError(
             f"Tried to retrieve child element '{name}' from '{xml}' but child was "
@@ -346,11 +606,11 @@ def element_as_text(xml, name, config: ParserConfig) -> str:
         empty string is returned.
 
     """
-    text = child_element(xml, name, config, xpath_function="/text()")
+    text = child_element_text(xml, name, config)
     if text is None:
         return ""
     else:
-        return str(text)
+        return text
 
 
 def element_as_float(xml, name, config: ParserConfig) -> float | None:
@@ -373,16 +633,67 @@ def element_as_float(xml, name, config: ParserConfig) -> float | None:
         invalid float representation, :py:data:`None` is returned.
 
     """
-    text = child_element(xml, name, config, xpath_function="/text()")
+    text = child_element_text(xml, name, config)
     if text is None:
         return None
     else:
         try:
-            return float(str(text))
+            return float(text)
         except ValueError:
             return None
 
 
+def elements_as_float(
+    xml, names: Sequence[str], config: ParserConfig
+) -> dict[str, float | None]:
+    """
+    Convert several named children of the given XML element to their float values.
+
+    The children are looked up in a single pass over the child elements, rather
+    than one pass per name.
+
+    Parameters
+    ----------
+    xml
+        XML element to operate on.
+    names
+        Names of the child elements to look for.
+    config
+        Additional parser configuration.
+
+    Raises
+    ------
+    :class:`ParsingError` if more than one child element with the same name is found.
+
+    Returns
+    -------
+    :class:`dict`
+        *dict* of child element names and their values as float. If a child element
+        is not found or has an invalid float representation, its value is
+        :py:data:`None`.
+
+    """
+    qualified_names = {fully_qualified_name(name, config): name for name in names}
+    texts: dict[str, str | None] = {}
+    for element in xml:
+        name = qualified_names.get(element.tag)
+        if name is None:
+            continue
+        if name in texts:
+            raise ParsingError(
+                f"Found multiple elements of type {name} in "
+                f"element {xml}, but only expected exactly one."
+            )
+        texts[name] = element.text
+    values: dict[str, float | None] = dict.fromkeys(names)
+    for name, text in texts.items():
+        if text is None:
+            continue
+        with contextlib.suppress(ValueError):
+            values[name] = float(text)
+    return values
+
+
 def elements_as_text_list(xml, name, config: ParserConfig):
     """
     Return one or more child elements of the given XML element as a list of strings.
@@ -403,18 +714,29 @@ def elements_as_text_list(xml, name, config: ParserConfig):
         a child element.
 
     """
-    if config.clf_namespace_prefix_mapping():
-        return xml.xpath(
-            f"clf:{name}/text()", namespaces=config.clf_namespace_prefix_mapping()
-        )
-    else:
-        return xml.xpath(f"{name}/text()")
+    return _child_xpath(name, config.namespace_name, "/text()")(xml)
 
 
 def sliding_window(iterable, n):
     """
     Collect data into overlapping fixed-length chunks or blocks.
     Source: https://docs.python.org/3/library/itertools.html
+
+    Examples
+    --------
+    >>> list(sliding_window("ABCD", 2))
+    [('A', 'B'), ('B', 'C'), ('C', 'D')]
+    >>> list(sliding_window("ABCD", 3))
+    [('A', 'B', 'C'), ('B', 'C', 'D')]
+    """
+    if n == 2:
+        return pairwise(iterable)
+    return _sliding_window(iterable, n)
+
+
+def _sliding_window(iterable, n):
+    """
+    Collect data into overlapping fixed-length chunks or blocks of arbitrary length.
     """
     it = iter(iterable)
     window = collections.deque(islice(it, n - 1), maxlen=n)
@@ -423,6 +745,89 @@ def sliding_window(iterable, n):
         yield tuple(window)
 
 
+def _fromstring_raises_on_unmatched_data() -> bool:
+    """
+    Return whether :func:`numpy.fromstring` raises a :class:`ValueError` for data
+    that cannot be parsed, which is the case from *NumPy* 2.3 onwards.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            np.fromstring("0 _", dtype=np.float64, sep=" ")
+        except ValueError:
+            return True
+    return False
+
+
+_FROMSTRING_RAISES = _fromstring_raises_on_unmatched_data()
+
+_FROMSTRING_WARNINGS_LOCK = threading.Lock()
+
+
+def _fromstring(s: str) -> npt.NDArray[np.float64]:
+    """
+    Parse the given whitespace separated values with :func:`numpy.fromstring`,
+    raising on data that cannot be parsed regardless of the *NumPy* version.
+
+    Older *NumPy* versions only emit a :class:`DeprecationWarning` and return the
+    values parsed so far, the warning is then turned into an exception. As
+    :func:`warnings.catch_warnings` modifies process wide state, concurrent calls
+    are serialised in that case.
+    """
+    if _FROMSTRING_RAISES:
+        return np.fromstring(s, dtype=np.float64, sep=" ")
+    with _FROMSTRING_WARNINGS_LOCK, warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        return np.fromstring(s, dtype=np.float64, sep=" ")
+
+
+def parse_floats(s: str | None, count: int | None = None) -> npt.NDArray[np.float64]:
+    """
+    Parse the given value as a whitespace separated list of floating point values.
+
+    Parameters
+    ----------
+    s
+        String to parse.
+    count
+        Expected number of values, if known in advance.
+
+    Raises
+    ------
+    :class:`ParsingError`
+        If `s` contains values that cannot be parsed as floats, or if the number of
+        values does not match `count`.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        One dimensional array of the floating point values.
+
+    Examples
+    --------
+    >>> parse_floats(" 0.5 1  2e-1 ")
+    array([0.5, 1. , 0.2])
+    >>> parse_floats("   ")
+    array([], dtype=float64)
+    """
+    # "numpy.fromstring" returns "[-1.]" for empty or whitespace-only input.
+    if s is None or not s.strip():
+        values = np.empty(0, dtype=np.float64)
+    else:
+        # The expected count is deliberately not passed to "numpy.fromstring": a
+        # shorter input would be padded with uninitialised values instead of raising
+        # an error.
+        try:
+            values = _fromstring(s)
+        except (ValueError, DeprecationWarning) as exception:
+            raise ParsingError(
+                f"Failed to parse float values from {s}: {exception}"
+            ) from exception
+    if count is not None and values.size != count:
+        raise ParsingError(f"Expected {count} float values, but found {values.size}.")
+    return values
+
+
 def three_floats(s: str | None) -> tuple[float, float, float]:
     """
     Parse the given value as a comma separated list of floating point values.
@@ -448,6 +853,4 @@ def three_floats(s: str | None) -> tuple[float, float, float]:
     parts = s.split()
     if len(parts) != 3:
         raise ParsingError(f"Failed to parse three float values from {s}")
-    values = tuple(map(float, parts))
-    # Repacking here to satisfy type check.
-    return values[0], values[1], values[2]
+    return float(parts[0]), float(parts[1]), float(parts[2])
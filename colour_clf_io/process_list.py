@@ -8,18 +8,20 @@ Defines the top level Process List object that represents a CLF process.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-import lxml.etree
 from _warnings import warn
 
-from colour_clf_io.elements import Info
-from colour_clf_io.errors import ParsingError
+from colour_clf_io.elements import Info, parsed_array_values
 from colour_clf_io.parsing import (
     ParserConfig,
     element_as_text,
     elements_as_text_list,
+    fully_qualified_name,
     must_have,
+    parse_floats,
+    parser_config_for_namespace,
 )
 from colour_clf_io.process_nodes import (
     ProcessNode,
@@ -37,7 +39,7 @@ __status__ = "Production"
 __ALL__ = ["ProcessList"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessList:
     """
     Represents a Process List.
@@ -61,7 +63,7 @@ class ProcessList:
     info: Info | None
 
     @staticmethod
-    def from_xml(xml):
+    def from_xml(xml, array_workers: int | None = None):
         """
         Parse and return the Process List from the given XML node. Returns None if the
         given element is None.
@@ -69,6 +71,15 @@ class ProcessList:
         Expects the xml element to be a valid element according to the CLF
         specification.
 
+        Parameters
+        ----------
+        xml
+            XML element to parse.
+        array_workers
+            Number of threads used to parse the values of the *Array* elements
+            concurrently before the process nodes are parsed. The default parses
+            them sequentially, which is preferable for small documents.
+
         Raises
         ------
         :class: ParsingError
@@ -87,17 +98,12 @@ class ProcessList:
             "ProcessList must contain an `compCLFversion` attribute",
         )
 
-        # By default, we would expect the correct namespace as per the specification.
-        # But if it is not present, we will still try to parse the document anyway.
-        # We won't accept a wrong namespace through.
-        config = ParserConfig()
-        namespace = xml.xpath("namespace-uri(.)")
-        if not namespace:
-            config.namespace_name = None
-        elif namespace != config.namespace_name:
-            raise ParsingError(
-                f"Found invalid xmlns attribute in process list: {namespace}"
-            )
+        config = parser_config_for_namespace(xml.xpath("namespace-uri(.)"))
+
+        if array_workers is not None and array_workers > 1:
+            array_values = _parse_array_values(xml, config, array_workers)
+        else:
+            array_values = {}
 
         name = xml.get("name")
         inverse_of = xml.get("inverseOf")
@@ -107,15 +113,15 @@ class ProcessList:
         input_descriptor = element_as_text(xml, "InputDescriptor", config)
         output_descriptor = element_as_text(xml, "OutputDescriptor", config)
 
-        ignore_nodes = ["Description", "InputDescriptor", "OutputDescriptor", "Info"]
-        process_nodes = filter(
-            lambda node: lxml.etree.QName(node).localname not in ignore_nodes, xml
-        )
+        ignore_tags = config.ignore_tags
+        with parsed_array_values(array_values):
+            process_nodes = [
+                parse_process_node(xml_node, config)
+                for xml_node in xml
+                if xml_node.tag not in ignore_tags
+            ]
         if not process_nodes:
             warn("Got empty process node.")
-        process_nodes = [
-            parse_process_node(xml_node, config) for xml_node in process_nodes
-        ]
         assert_bit_depth_compatibility(process_nodes)
 
         return ProcessList(
@@ -129,3 +135,32 @@ class ProcessList:
             info=info,
             description=description,
         )
+
+
+def _parse_array_values(xml, config: ParserConfig, max_workers: int) -> dict:
+    """
+    Parse the values of all the *Array* elements of the given XML element using a
+    thread pool. The text conversion in :func:`numpy.fromstring` releases the GIL,
+    allowing multiple large *LUT* payloads to be converted in parallel.
+
+    Parameters
+    ----------
+    xml
+        XML element whose descendant *Array* elements are parsed.
+    config
+        Additional parser configuration.
+    max_workers
+        Maximum number of threads to use.
+
+    Returns
+    -------
+    :class:`dict`
+        *dict* of *Array* elements and their parsed values.
+    """
+    arrays = list(xml.iter(fully_qualified_name("Array", config)))
+    if not arrays:
+        return {}
+    texts = [array.text for array in arrays]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        values = list(executor.map(parse_floats, texts))
+    return dict(zip(arrays, values))
@@ -9,11 +9,16 @@ Defines the available process nodes in a CLF document.
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import pairwise
 
 import lxml.etree
 
 from colour_clf_io.elements import (
+    EXPONENT_STYLE_BY_VALUE,
+    LOG_STYLE_BY_VALUE,
+    RANGE_STYLE_BY_VALUE,
     Array,
     ExponentParams,
     ExponentStyle,
@@ -25,17 +30,23 @@ from colour_clf_io.elements import (
 )
 from colour_clf_io.errors import ParsingError, ValidationError
 from colour_clf_io.parsing import (
+    NAMESPACE_NAME,
+    XML_PARSER_OPTIONS,
     ParserConfig,
     XMLParsable,
     child_element,
+    child_element_by_tag,
     child_elements,
-    element_as_float,
-    element_as_text,
-    map_optional,
-    retrieve_attributes,
-    sliding_window,
+    elements_as_float,
+    lookup_optional,
+    must_have,
+    parser_config_for_namespace,
 )
 from colour_clf_io.values import (
+    ASC_CDL_STYLE_BY_VALUE,
+    BIT_DEPTH_BY_VALUE,
+    INTERPOLATION_1D_BY_VALUE,
+    INTERPOLATION_3D_BY_VALUE,
     ASC_CDL_Style,
     BitDepth,
     Interpolation1D,
@@ -51,15 +62,19 @@ __ALL__ = [
     "Log",
     "Exponent",
     "ASC_CDL",
+    "parse_process_list_stream",
 ]
 
 processing_node_constructors = {}
 
+_RANGE_VALUE_NAMES = ("minInValue", "maxInValue", "minOutValue", "maxOutValue")
+
 
 def register_process_node_xml_constructor(name):
     """
     Add the constructor method to the `processing_node_constructors` dictionary.
-    Adds the wrapped function as value with the given name as key.
+    Adds the wrapped function as value with the given name, and the name qualified
+    with the CLF namespace, as keys.
 
     Parameters
     ----------
@@ -70,12 +85,13 @@ def register_process_node_xml_constructor(name):
 
     def register(constructor):
         processing_node_constructors[name] = constructor
+        processing_node_constructors[f"{{{NAMESPACE_NAME}}}{name}"] = constructor
         return constructor
 
     return register
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessNode(XMLParsable, ABC):
     """
     Represents the common data of all Process Node elements.
@@ -110,21 +126,23 @@ class ProcessNode(XMLParsable, ABC):
             *dict* of attribute names and their values.
 
         """
-        attributes = retrieve_attributes(
-            xml,
-            {
-                "id": "id",
-                "name": "name",
-            },
+        attrib = xml.attrib
+        in_bit_depth = lookup_optional(BIT_DEPTH_BY_VALUE, attrib.get("inBitDepth"))
+        must_have(in_bit_depth, "ProcessNode must contain an `inBitDepth` attribute")
+        out_bit_depth = lookup_optional(BIT_DEPTH_BY_VALUE, attrib.get("outBitDepth"))
+        must_have(out_bit_depth, "ProcessNode must contain an `outBitDepth` attribute")
+        description_element = child_element_by_tag(xml, config.description_tag)
+        description = (
+            ""
+            if description_element is None or description_element.text is None
+            else description_element.text
         )
-        in_bit_depth = BitDepth(xml.get("inBitDepth"))
-        out_bit_depth = BitDepth(xml.get("outBitDepth"))
-        description = element_as_text(xml, "Description", config)
         args = {
+            "id": attrib.get("id"),
+            "name": attrib.get("name"),
             "in_bit_depth": in_bit_depth,
             "out_bit_depth": out_bit_depth,
             "description": description,
-            **attributes,
         }
         return args
 
@@ -168,9 +186,9 @@ def assert_bit_depth_compatibility(process_nodes: list[ProcessNode]) -> bool:
     ValidationError: ...
     ```
     """
-    for node_a, node_b in sliding_window(process_nodes, 2):
-        is_compatible = node_a.out_bit_depth == node_b.in_bit_depth
-        if not is_compatible:
+    # Enum members are singletons, so they can be compared by identity.
+    for node_a, node_b in pairwise(process_nodes):
+        if node_a.out_bit_depth is not node_b.in_bit_depth:
             raise ValidationError(
                 f"Encountered incompatible bit depth between two processing nodes: "
                 f"{node_a} and {node_b}"
@@ -194,14 +212,67 @@ def parse_process_node(xml, config: ParserConfig):
         correctly correspond to the specification..
 
     """
-    tag = lxml.etree.QName(xml).localname
-    constructor = processing_node_constructors.get(tag)
+    constructor = processing_node_constructors.get(xml.tag)
+    if constructor is None:
+        constructor = processing_node_constructors.get(lxml.etree.QName(xml).localname)
     if constructor is not None:
-        return processing_node_constructors[tag](xml, config)
+        return constructor(xml, config)
     raise ParsingError(f"Encountered invalid processing node with tag '{xml.tag}'")
 
 
-@dataclass
+def parse_process_list_stream(source) -> Iterator[ProcessNode]:
+    """
+    Parse the process nodes of the given *CLF* document incrementally and yield them
+    in document order.
+
+    Unlike :func:`colour_clf_io.read_clf`, the document tree is not kept in memory as
+    every process node element is released once it has been parsed. The attributes
+    and metadata of the *ProcessList* are not parsed, and the bit depth compatibility
+    of the process nodes is not validated.
+
+    Parameters
+    ----------
+    source
+        Path or file-like object of the *CLF* document.
+
+    Yields
+    ------
+    :class: colour.clf.ProcessNode
+        The parsed process nodes.
+
+    Raises
+    ------
+    :class: ParsingError
+        If the document uses a namespace other than the CLF namespace, or a process
+        node does not correctly correspond to the specification.
+
+    """
+    events = lxml.etree.iterparse(  # noqa: S320
+        source,
+        events=("start", "end"),
+        **XML_PARSER_OPTIONS,
+    )
+    # The first event is the start of the root element, whose namespace determines
+    # the parser configuration, as in "ProcessList.from_xml".
+    _, root = next(events)
+    config = parser_config_for_namespace(lxml.etree.QName(root).namespace)
+    tags = frozenset(
+        tag
+        for tag in processing_node_constructors
+        if lxml.etree.QName(tag).namespace == config.namespace_name
+    )
+    for event, element in events:
+        if event != "end" or element.tag not in tags:
+            continue
+        yield parse_process_node(element, config)
+        # Release the parsed node and its preceding siblings.
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+@dataclass(slots=True)
 class LUT1D(ProcessNode):
     """
     Represents a LUT1D element.
@@ -240,9 +311,12 @@ class LUT1D(ProcessNode):
         if array is None:
             raise ParsingError("LUT1D processing node does not have an Array element.")
 
-        half_domain = xml.get("halfDomain") == "true"
-        raw_halfs = xml.get("rawHalfs") == "true"
-        interpolation = map_optional(Interpolation1D, xml.get("interpolation"))
+        attrib = xml.attrib
+        half_domain = attrib.get("halfDomain") == "true"
+        raw_halfs = attrib.get("rawHalfs") == "true"
+        interpolation = lookup_optional(
+            INTERPOLATION_1D_BY_VALUE, attrib.get("interpolation")
+        )
         return LUT1D(
             array=array,
             half_domain=half_domain,
@@ -252,7 +326,7 @@ class LUT1D(ProcessNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LUT3D(ProcessNode):
     """
     Represents a LUT3D element.
@@ -290,9 +364,14 @@ class LUT3D(ProcessNode):
         array = Array.from_xml(child_element(xml, "Array", config), config)
         if array is None:
             raise ParsingError("LUT3D processing node does not have an Array element.")
-        half_domain = xml.get("halfDomain") == "true"
-        raw_halfs = xml.get("rawHalfs") == "true"
-        interpolation = Interpolation3D(xml.get("interpolation"))
+        attrib = xml.attrib
+        half_domain = attrib.get("halfDomain") == "true"
+        raw_halfs = attrib.get("rawHalfs") == "true"
+        # The interpolation attribute is optional, a missing value is kept as None
+        # rather than substituting the "trilinear" default of the specification.
+        interpolation = lookup_optional(
+            INTERPOLATION_3D_BY_VALUE, attrib.get("interpolation")
+        )
         return LUT3D(
             array=array,
             half_domain=half_domain,
@@ -302,7 +381,7 @@ class LUT3D(ProcessNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Matrix(ProcessNode):
     """
     Represents a Matrix element.
@@ -340,7 +419,7 @@ class Matrix(ProcessNode):
         return Matrix(array=array, **super_args)
 
 
-@dataclass
+@dataclass(slots=True)
 class Range(ProcessNode):
     """
     Represents a Range element.
@@ -379,27 +458,21 @@ class Range(ProcessNode):
 
         super_args = ProcessNode.parse_attributes(xml, config)
 
-        def optional_float(name):
-            return element_as_float(xml, name, config)
-
-        min_in_value = optional_float("minInValue")
-        max_in_value = optional_float("maxInValue")
-        min_out_value = optional_float("minOutValue")
-        max_out_value = optional_float("maxOutValue")
+        values = elements_as_float(xml, _RANGE_VALUE_NAMES, config)
 
-        style = map_optional(RangeStyle, xml.get("style"))
+        style = lookup_optional(RANGE_STYLE_BY_VALUE, xml.get("style"))
 
         return Range(
-            min_in_value=min_in_value,
-            max_in_value=max_in_value,
-            min_out_value=min_out_value,
-            max_out_value=max_out_value,
+            min_in_value=values["minInValue"],
+            max_in_value=values["maxInValue"],
+            min_out_value=values["minOutValue"],
+            max_out_value=values["maxOutValue"],
             style=style,
             **super_args,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Log(ProcessNode):
     """
     Represents a Log element.
@@ -432,7 +505,9 @@ class Log(ProcessNode):
         if xml is None:
             return None
         super_args = ProcessNode.parse_attributes(xml, config)
-        style = LogStyle(xml.get("style"))
+        style = lookup_optional(LOG_STYLE_BY_VALUE, xml.get("style"))
+        if style is None:
+            raise ParsingError("Log process node has no `style' value.")
         param_elements = child_elements(xml, "LogParams", config)
         params = [
             param
@@ -445,7 +520,7 @@ class Log(ProcessNode):
         return Log(style=style, log_params=params, **super_args)
 
 
-@dataclass
+@dataclass(slots=True)
 class Exponent(ProcessNode):
     """
     Represents a Exponent element.
@@ -478,7 +553,7 @@ class Exponent(ProcessNode):
         if xml is None:
             return None
         super_args = ProcessNode.parse_attributes(xml, config)
-        style = map_optional(ExponentStyle, xml.get("style"))
+        style = lookup_optional(EXPONENT_STYLE_BY_VALUE, xml.get("style"))
         if style is None:
             raise ParsingError("Exponent process node has no `style' value.")
         param_elements = child_elements(xml, "ExponentParams", config)
@@ -495,7 +570,7 @@ class Exponent(ProcessNode):
         return Exponent(style=style, exponent_params=params, **super_args)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASC_CDL(ProcessNode):
     """
     Represents a ASC_CDL element.
@@ -529,7 +604,9 @@ class ASC_CDL(ProcessNode):
         if xml is None:
             return None
         super_args = ProcessNode.parse_attributes(xml, config)
-        style = ASC_CDL_Style(xml.get("style"))
+        style = lookup_optional(ASC_CDL_STYLE_BY_VALUE, xml.get("style"))
+        if style is None:
+            raise ParsingError("ASC_CDL process node has no `style' value.")
         sopnode = SOPNode.from_xml(child_element(xml, "SOPNode", config), config)
         sat_node = SatNode.from_xml(child_element(xml, "SatNode", config), config)
         return ASC_CDL(style=style, sopnode=sopnode, sat_node=sat_node, **super_args)
@@ -2,7 +2,6 @@
 Defines helper functionality for CLF tests.
 """
 
-import os
 import tempfile
 
 import numpy as np
@@ -48,18 +47,24 @@ def snippet_to_process_list(snippet: str) -> colour_clf_io.process_list.ProcessL
     return colour_clf_io.parse_clf(doc)
 
 
-def snippet_as_tmp_file(snippet):
+def snippet_as_tmp_file(snippet, directory):
+    """# noqa: D401
+    Writes the snippet, wrapped into a CLF document, to a new file in the given
+    directory, e.g. pytest's `tmp_path`, and returns its path.
+    """
     doc = wrap_snippet(snippet)
-    tmp_folder = tempfile.gettempdir()
-    file_name = os.path.join(tmp_folder, "colour_snippet.clf")
-    with open(file_name, "w") as f:
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".clf", dir=directory, delete=False
+    ) as f:
         f.write(doc)
-    return file_name
+    return f.name
 
 
 def result_as_array(result_text):
-    result_parts = result_text.decode("utf-8").strip().split()
-    if len(result_parts) != 3:
+    try:
+        result_values = np.fromstring(result_text, dtype=np.float64, sep=" ")
+    except ValueError as exception:
+        raise RuntimeError(f"Invalid OCIO result: {result_text}") from exception
+    if result_values.size != 3:
         raise RuntimeError(f"Invalid OCIO result: {result_text}")
-    result_values = list(map(float, result_parts))
-    return np.array(result_values)
+    return result_values
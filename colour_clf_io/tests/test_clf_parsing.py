@@ -1,14 +1,19 @@
 # !/usr/bin/env python
 """Define the unit tests for the :mod:`colour.io.clf` module."""
 
+import dataclasses
+import io
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import numpy as np
 import pytest
 from test_clf_common import wrap_snippet
 
 import colour_clf_io.elements
+import colour_clf_io.parsing
 import colour_clf_io.process_nodes
 import colour_clf_io.values
 from colour_clf_io import parse_clf, read_clf
@@ -87,6 +92,58 @@ class TestParseCLF(unittest.TestCase):
         self.assertEqual(clf_data.output_descriptor, "ACES (SMPTE ST 2065-1)")
         self.assertEqual(len(clf_data.process_nodes), 7)
 
+    def test_read_with_array_workers(self):
+        """
+        Test that parsing the array values concurrently gives the same result as
+        parsing them sequentially.
+        """
+        path = os.path.join(ROOT_CLF, "LMT_ARRI_K1S1_709_EI800_v3.xml")
+        expected = read_clf(path)
+        # The arrays must use the values parsed by the pool instead of parsing their
+        # text again.
+        with mock.patch(
+            "colour_clf_io.elements.parse_floats", side_effect=AssertionError
+        ):
+            self.assertEqual(read_clf(path, array_workers=4), expected)
+        self.assertIsNone(colour_clf_io.elements._PARSED_ARRAY_VALUES.get())
+
+    def test_parse_process_list_stream(self):
+        """
+        Test that streaming the process nodes of a document gives the same nodes as
+        parsing the whole document.
+        """
+        path = os.path.join(ROOT_CLF, "LMT Kodak 2383 Print Emulation.xml")
+        self.assertEqual(
+            list(colour_clf_io.process_nodes.parse_process_list_stream(path)),
+            read_clf(path).process_nodes,
+        )
+
+    def test_parse_process_list_stream_namespace(self):
+        """
+        Test streaming the process nodes of documents without the CLF namespace and
+        with a foreign namespace.
+        """
+        example = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <ProcessList id="stream" compCLFversion="3.0"{0}>
+            <Description>Process list</Description>
+            <Exponent inBitDepth="16f" outBitDepth="16f" style="monCurveRev">
+                <ExponentParams exponent="2.4" offset="0.055" />
+            </Exponent>
+        </ProcessList>
+        """
+        parse_process_list_stream = (
+            colour_clf_io.process_nodes.parse_process_list_stream
+        )
+
+        document = example.replace(b"{0}", b"")
+        nodes = list(parse_process_list_stream(io.BytesIO(document)))
+        self.assertEqual(nodes, parse_clf(document).process_nodes)
+        self.assertEqual(len(nodes), 1)
+
+        document = example.replace(b"{0}", b' xmlns="urn:invalid"')
+        with pytest.raises(ParsingError):
+            list(parse_process_list_stream(io.BytesIO(document)))
+
     def test_LUT1D_example(self):
         """
         Test parsing of the example process node from the official CLF specification
@@ -116,6 +173,83 @@ class TestParseCLF(unittest.TestCase):
         np.testing.assert_array_almost_equal(
             node.array.as_array(), np.array([3, 2, 1, 0])
         )
+        self.assertIsInstance(node.array.values, np.ndarray)
+        self.assertEqual(node.array.values_list, [3.0, 2.0, 1.0, 0.0])
+
+    def test_array_equality(self):
+        """
+        Test the comparison of parsed array elements.
+        """
+        example = """
+        <LUT1D inBitDepth="12i" outBitDepth="12i">
+            <Array dim="4 1">
+                3
+                2
+                1
+                0
+            </Array>
+        </LUT1D>
+        """
+        array_a = parse_clf(wrap_snippet(example)).process_nodes[0].array
+        array_b = parse_clf(wrap_snippet(example)).process_nodes[0].array
+        self.assertEqual(array_a, array_b)
+        self.assertNotEqual(
+            array_a,
+            colour_clf_io.elements.Array(values=np.array([3, 2, 1, 1]), dim=(4, 1)),
+        )
+        self.assertNotEqual(
+            array_a,
+            colour_clf_io.elements.Array(values=np.array([3, 2, 1, 0]), dim=(2, 2)),
+        )
+
+    def test_fail_on_array_size_mismatch(self):
+        """
+        Test parsing of an array whose number of values does not match its `dim`
+        attribute.
+        """
+        example = """
+        <LUT1D inBitDepth="12i" outBitDepth="12i">
+            <Array dim="4 1">
+                3
+                2
+                1
+            </Array>
+        </LUT1D>
+        """
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example))
+
+    def test_fail_on_trailing_garbage_in_array(self):
+        """
+        Test parsing of an array whose values are followed by invalid data.
+        """
+        example = """
+        <Matrix inBitDepth="32f" outBitDepth="32f">
+            <Array dim="3 3">
+                1 0 0
+                0 1 0
+                0 0 1 garbage
+            </Array>
+        </Matrix>
+        """
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example))
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example), array_workers=2)
+
+    def test_fail_on_empty_array(self):
+        """
+        Test parsing of an array that contains no values.
+        """
+        example = """
+        <LUT1D inBitDepth="12i" outBitDepth="12i">
+            <Array dim="1 1">   </Array>
+        </LUT1D>
+        """
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example))
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example), array_workers=2)
 
     def test_LUT3D_example(self):
         """
@@ -165,6 +299,35 @@ class TestParseCLF(unittest.TestCase):
             ),
         )
 
+    def test_LUT3D_without_interpolation(self):
+        """
+        Test parsing of a LUT3D that omits the optional `interpolation` attribute.
+        """
+        example = """
+        <LUT3D inBitDepth="32f" outBitDepth="32f">
+            <Array dim="2 2 2 3">
+                0.0 0.0 0.0
+                0.0 0.0 1.0
+                0.0 1.0 0.0
+                0.0 1.0 1.0
+                1.0 0.0 0.0
+                1.0 0.0 1.0
+                1.0 1.0 0.0
+                1.0 1.0 1.0
+            </Array>
+        </LUT3D>
+        """
+        node = parse_clf(wrap_snippet(example)).process_nodes[0]
+        self.assertIsInstance(node, colour_clf_io.process_nodes.LUT3D)
+        self.assertIsNone(node.interpolation)
+
+        with pytest.raises(ParsingError):
+            parse_clf(
+                wrap_snippet(
+                    example.replace("<LUT3D ", '<LUT3D interpolation="cubic" ')
+                )
+            )
+
     def test_matrix_example_1(self):
         """
         Test parsing of the example process node from the official CLF specification
@@ -325,6 +488,50 @@ class TestParseCLF(unittest.TestCase):
         self.assertAlmostEqual(node.log_params[0].lin_side_break, 0.0078)
         self.assertAlmostEqual(node.log_params[0].linear_slope, 6.025)
 
+    def test_fail_on_invalid_log_style(self):
+        """
+        Test parsing of a log process node with an invalid `style` attribute.
+        """
+        example = """
+        <Log inBitDepth="32f" outBitDepth="32f" style="invalidStyle">
+        </Log>
+        """
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example))
+
+    def test_missing_description(self):
+        """
+        Test parsing of process nodes without or with an empty `Description`.
+        """
+        example = """
+        <Range inBitDepth="32f" outBitDepth="32f">
+            <minInValue>0.0</minInValue>
+        </Range>
+        <Range inBitDepth="32f" outBitDepth="32f">
+            <Description/>
+            <minInValue>0.0</minInValue>
+        </Range>
+        """
+        doc = parse_clf(wrap_snippet(example))
+        self.assertEqual(doc.process_nodes[0].description, "")
+        self.assertEqual(doc.process_nodes[1].description, "")
+
+    def test_fail_on_invalid_bit_depth(self):
+        """
+        Test parsing of a process node with an invalid `inBitDepth` attribute.
+        """
+        example = """
+        <Matrix inBitDepth="9i" outBitDepth="32f">
+            <Array dim="3 3">
+                1.0 0.0 0.0
+                0.0 1.0 0.0
+                0.0 0.0 1.0
+            </Array>
+        </Matrix>
+        """
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example))
+
     def test_exponent_example_1(self):
         """
         Test parsing of the example process node from the official CLF specification
@@ -448,6 +655,31 @@ class TestParseCLF(unittest.TestCase):
         self.assertEqual(node.sopnode.power, (1.2500000, 1.000000, 1.000000))
         self.assertAlmostEqual(node.sat_node.saturation, 1.700000)
 
+    def test_fail_on_duplicate_child_element(self):
+        """
+        Test parsing of a process node that contains a child element more than once
+        where only a single one is allowed.
+        """
+        example = """
+        <ASC_CDL id="cc01234" inBitDepth="16f" outBitDepth="16f" style="Fwd">
+            <SatNode>
+                <Saturation>1.700000</Saturation>
+                <Saturation>1.200000</Saturation>
+            </SatNode>
+        </ASC_CDL>
+        """
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example))
+
+        example = """
+        <Range inBitDepth="32f" outBitDepth="32f">
+            <minInValue>0.0</minInValue>
+            <minInValue>0.1</minInValue>
+        </Range>
+        """
+        with pytest.raises(ParsingError):
+            parse_clf(wrap_snippet(example))
+
     def test_ACES2065_1_to_ACEScg_example(self):
         """
         Test parsing of the example process node from the official CLF specification
@@ -575,6 +807,79 @@ class TestParseCLF(unittest.TestCase):
             "attribute."
         )
 
+    def test_parse_without_namespace(self):
+        """
+        Test parsing of a process list that does not declare the CLF namespace.
+        """
+        example = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <ProcessList id="no-namespace" compCLFversion="3.0">
+            <Description>Process list without namespace</Description>
+            <Exponent inBitDepth="16f" outBitDepth="16f" style="monCurveRev">
+                <Description>Exponent</Description>
+                <ExponentParams exponent="2.4" offset="0.055" />
+            </Exponent>
+        </ProcessList>
+        """
+        doc = parse_clf(example)
+        self.assertEqual(doc.description, ["Process list without namespace"])
+        self.assertEqual(len(doc.process_nodes), 1)
+        node = doc.process_nodes[0]
+        self.assertIsInstance(node, colour_clf_io.process_nodes.Exponent)
+        self.assertEqual(node.description, "Exponent")
+        self.assertAlmostEqual(node.exponent_params[0].exponent, 2.4)
+
+    def test_xml_parser_per_thread(self):
+        """
+        Test that the XML parser is reused within a thread but not across threads.
+        """
+        parser = colour_clf_io._xml_parser()
+        self.assertIs(colour_clf_io._xml_parser(), parser)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_parser = executor.submit(colour_clf_io._xml_parser).result()
+        self.assertIsNot(other_parser, parser)
+
+    def test_parser_config_is_frozen(self):
+        """
+        Test that the parser configuration is immutable and hashable.
+        """
+        config = colour_clf_io.parsing.ParserConfig()
+        self.assertEqual(config, colour_clf_io.parsing.CLF_NAMESPACE_CONFIG)
+        self.assertEqual(hash(config), hash(colour_clf_io.parsing.ParserConfig()))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.namespace_name = None  # pyright: ignore
+
+    def test_warn_on_empty_process_list(self):
+        """
+        Test parsing of a process list that does not contain any process nodes.
+        """
+        example = """
+        <Description>Empty process list</Description>
+        """
+        with pytest.warns(UserWarning):
+            doc = parse_clf(wrap_snippet(example))
+        self.assertEqual(doc.process_nodes, [])
+
+    def test_ignore_comments(self):
+        """
+        Test parsing of a process list that contains comments between and within
+        process nodes.
+        """
+        example = """
+        <!-- Leading comment. -->
+        <Range inBitDepth="10i" outBitDepth="10i">
+            <!-- Inner comment. -->
+            <minInValue>0</minInValue>
+            <maxInValue>1023</maxInValue>
+        </Range>
+        <!-- Trailing comment. -->
+        """
+        doc = parse_clf(wrap_snippet(example))
+        self.assertEqual(len(doc.process_nodes), 1)
+        node = doc.process_nodes[0]
+        self.assertIsInstance(node, colour_clf_io.process_nodes.Range)
+        self.assertEqual(node.min_in_value, 0.0)
+        self.assertEqual(node.max_in_value, 1023.0)
+
     @pytest.mark.with_ocio
     def test_CLF_from_OCIO(self):
         """
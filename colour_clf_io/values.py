@@ -10,8 +10,12 @@ document.
 from __future__ import annotations
 
 import enum
+from collections.abc import Iterable
 from enum import Enum
 
+import numpy as np
+import numpy.typing as npt
+
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2013 Colour Developers"
 __license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
@@ -25,6 +29,7 @@ __ALL__ = [
     "Interpolation1D",
     "Interpolation3D",
     "ASC_CDL_Style",
+    "scale_factors_array",
 ]
 
 
@@ -63,17 +68,7 @@ class BitDepth(Enum):
 
         ```
         """
-        if self == BitDepth.i8:
-            return 2**8 - 1
-        elif self == BitDepth.i10:
-            return 2**10 - 1
-        elif self == BitDepth.i12:
-            return 2**12 - 1
-        elif self == BitDepth.i16:
-            return 2**16 - 1
-        elif self in [BitDepth.f16, BitDepth.f32]:
-            return 1.0
-        raise NotImplementedError()
+        return _SCALE_FACTORS[self]
 
     @classmethod
     def all(cls):
@@ -91,6 +86,37 @@ class BitDepth(Enum):
         return [e.value for e in cls]
 
 
+BIT_DEPTH_BY_VALUE = {member.value: member for member in BitDepth}
+
+
+_SCALE_FACTORS = {
+    BitDepth.i8: 2**8 - 1,
+    BitDepth.i10: 2**10 - 1,
+    BitDepth.i12: 2**12 - 1,
+    BitDepth.i16: 2**16 - 1,
+    BitDepth.f16: 1.0,
+    BitDepth.f32: 1.0,
+}
+
+
+def scale_factors_array(bit_depths: Iterable[BitDepth]) -> npt.NDArray[np.float64]:
+    """Return the scale factors of the given BitDepth values as an array, so that
+    values of different bit depths can be normalised with a single division.
+
+    Examples
+    --------
+    ```
+    >>> from colour_clf_io.values import BitDepth, scale_factors_array
+    >>> scale_factors_array([BitDepth.i8, BitDepth.i10, BitDepth.f16]).tolist()
+    [255.0, 1023.0, 1.0]
+
+    ```
+    """
+    return np.fromiter(
+        (_SCALE_FACTORS[bit_depth] for bit_depth in bit_depths), dtype=np.float64
+    )
+
+
 class Channel(enum.Enum):
     """
     Represents the valid values of the channel attribute in the Range element.
@@ -105,6 +131,9 @@ class Channel(enum.Enum):
     B = "B"
 
 
+CHANNEL_BY_VALUE = {member.value: member for member in Channel}
+
+
 class Interpolation1D(Enum):
     """
     Represents the valid interpolation values of a LUT1D element.
@@ -117,6 +146,9 @@ class Interpolation1D(Enum):
     LINEAR = "linear"
 
 
+INTERPOLATION_1D_BY_VALUE = {member.value: member for member in Interpolation1D}
+
+
 class Interpolation3D(Enum):
     """
     Represents the valid interpolation values of a LUT3D element.
@@ -130,6 +162,9 @@ class Interpolation3D(Enum):
     TETRAHEDRAL = "tetrahedral"
 
 
+INTERPOLATION_3D_BY_VALUE = {member.value: member for member in Interpolation3D}
+
+
 class ASC_CDL_Style(enum.Enum):
     """
     Represents the valid values of the style attribute of an ASC_CDL element.
@@ -143,3 +178,6 @@ class ASC_CDL_Style(enum.Enum):
     REV = "Rev"
     FWD_NO_CLAMP = "FwdNoClamp"
     REV_NO_CLAMP = "RevNoClamp"
+
+
+ASC_CDL_STYLE_BY_VALUE = {member.value: member for member in ASC_CDL_Style}